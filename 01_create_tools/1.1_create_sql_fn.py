@@ -17,6 +17,7 @@
 # MAGIC   2. `extract_product` -> product in issue_description (uses `ai_extract`)
 # MAGIC   3. `get_return_policy` -> return policy
 # MAGIC   4. `get_request_history` -> number of requests per issue category for that customer
+# MAGIC   5. `get_customer_profile` -> contact details, request counts per issue category and interaction history for a customer, from a precomputed snapshot
 # MAGIC
 # MAGIC While you can create tools coding them in LangChain/LangGraph, they may not be easily discovered for re-use. Instead, register them as [Unity Catalog Functions](https://docs.databricks.com/aws/en/generative-ai/agent-framework/agent-tool#unity-catalog-function-tools-vs-agent-code-tools)
 # MAGIC
@@ -203,7 +204,92 @@ spark.sql(f"CREATE SCHEMA IF NOT EXISTS {catalog_name}.{schema_name}")
 # COMMAND ----------
 
 # MAGIC %md
-# MAGIC ## 5. Check out the SQL functions in UC 
+# MAGIC ---
+# MAGIC
+# MAGIC ## 5. Look Up the Full Customer Profile in One Call
+# MAGIC - **Action**: Precompute one row per customer from `cust_service_data`, then look it up by `customer_id` or name.
+# MAGIC - **Why**: Contact details are repeated on every interaction row, and rebuilding a customer's context (latest interaction, request history, contact fields) otherwise takes several tool calls and agent turns.
+# MAGIC
+# MAGIC Each profile holds the identity fields once, interaction IDs and timestamps as arrays sorted by time, and the number of requests per issue category. Names are not unique (e.g. two different customers are named Destiny Brown), so a name lookup can return several profiles. It is a snapshot: rerun the cell below whenever `cust_service_data` changes. The agent therefore still answers live "latest interaction" questions with `get_latest_interaction`.
+# MAGIC
+# MAGIC ---
+
+# COMMAND ----------
+
+# DBTITLE 1,Build customer profile snapshots
+# MAGIC %sql
+# MAGIC CREATE OR REPLACE TABLE ${catalog_name}.${schema_name}.customer_profiles
+# MAGIC COMMENT 'One row per customer precomputed from cust_service_data'
+# MAGIC AS
+# MAGIC WITH category_counts AS (
+# MAGIC   SELECT customer_id, map_from_entries(collect_list(struct(issue_category, requests))) AS requests_by_category
+# MAGIC   FROM (
+# MAGIC     SELECT customer_id, issue_category, count(*) AS requests
+# MAGIC     FROM ${catalog_name}.${schema_name}.cust_service_data
+# MAGIC     GROUP BY customer_id, issue_category
+# MAGIC   )
+# MAGIC   GROUP BY customer_id
+# MAGIC ),
+# MAGIC interactions AS (
+# MAGIC   SELECT
+# MAGIC     customer_id,
+# MAGIC     -- contact fields are repeated on every row; keep the most recent values
+# MAGIC     max_by(name, date_time) AS name,
+# MAGIC     max_by(email, date_time) AS email,
+# MAGIC     max_by(phone_number, date_time) AS phone_number,
+# MAGIC     max_by(address, date_time) AS address,
+# MAGIC     count(*) AS total_requests,
+# MAGIC     max(date_time) AS latest_interaction_time,
+# MAGIC     max_by(issue_category, date_time) AS latest_issue_category,
+# MAGIC     max_by(issue_description, date_time) AS latest_issue_description,
+# MAGIC     array_sort(collect_list(struct(date_time, interaction_id))) AS history
+# MAGIC   FROM ${catalog_name}.${schema_name}.cust_service_data
+# MAGIC   GROUP BY customer_id
+# MAGIC )
+# MAGIC SELECT
+# MAGIC   i.customer_id, i.name, i.email, i.phone_number, i.address,
+# MAGIC   i.total_requests, c.requests_by_category,
+# MAGIC   i.latest_interaction_time, i.latest_issue_category, i.latest_issue_description,
+# MAGIC   transform(i.history, x -> x.interaction_id) AS interaction_ids,
+# MAGIC   transform(i.history, x -> x.date_time) AS interaction_times
+# MAGIC FROM interactions i
+# MAGIC JOIN category_counts c USING (customer_id)
+
+# COMMAND ----------
+
+# DBTITLE 1,Create function that retrieves the customer profile by ID or name
+# MAGIC %sql
+# MAGIC CREATE OR REPLACE FUNCTION ${catalog_name}.${schema_name}.get_customer_profile(customer STRING)
+# MAGIC RETURNS TABLE (
+# MAGIC   customer_id STRING, name STRING, email STRING, phone_number STRING, address STRING,
+# MAGIC   total_requests BIGINT, requests_by_category MAP<STRING, BIGINT>,
+# MAGIC   latest_interaction_time TIMESTAMP, latest_issue_category STRING, latest_issue_description STRING,
+# MAGIC   interaction_ids ARRAY<STRING>, interaction_times ARRAY<TIMESTAMP>
+# MAGIC )
+# MAGIC COMMENT "This takes a customer's customer_id or name as an input and returns the whole customer profile in one call: contact details (email, phone number, address), number of requests per issue category, the latest interaction, and all interaction IDs and timestamps in chronological order, as of the last snapshot rebuild. Use get_latest_interaction for the live queue. A name may match several customers, returning one row each; if so, do not merge them but disambiguate by customer_id, email or phone_number"
+# MAGIC LANGUAGE SQL
+# MAGIC RETURN 
+# MAGIC     SELECT *
+# MAGIC     FROM ${catalog_name}.${schema_name}.customer_profiles
+# MAGIC     WHERE customer_id = customer OR name = customer;
+
+# COMMAND ----------
+
+# DBTITLE 1,Test function that retrieves the customer profile by ID or name
+# MAGIC %sql
+# MAGIC -- lookup by customer_id returns exactly one profile
+# MAGIC select * from ${catalog_name}.${schema_name}.get_customer_profile('bdd640fb-0667-4ad1-9c80-317fa3b1799d')
+
+# COMMAND ----------
+
+# MAGIC %sql
+# MAGIC -- lookup by name can return one profile per customer sharing that name
+# MAGIC select * from ${catalog_name}.${schema_name}.get_customer_profile('Destiny Brown')
+
+# COMMAND ----------
+
+# MAGIC %md
+# MAGIC ## 6. Check out the SQL functions in UC 
 
 # COMMAND ----------
 
@@ -220,7 +306,7 @@ display(HTML(html_link))
 # COMMAND ----------
 
 # MAGIC %md
-# MAGIC ## 6. Test the tools in AI Playground
+# MAGIC ## 7. Test the tools in AI Playground
 # MAGIC - Bind the tools to a LLM that can reason and plan which tool to use
 # MAGIC - Dive deeper into the agent’s performance by exploring MLflow traces.
 # MAGIC
@@ -0,0 +1,151 @@
+"""
+Columnar cache of the source CSV tables in `data/` for local tools, index builds and evals.
+
+Each CSV is converted once into an uncompressed Arrow IPC file under `data/.cache/`, keyed by
+the sha256 of the source file, so edits to a CSV invalidate its cache automatically. The hash is
+remembered in a small sidecar file and only recomputed when the CSV's size or mtime changes, so a
+warm open costs one `stat()` plus an mmap. Cached tables
+are opened memory-mapped: projected columns and their strings are read straight from the
+mapped pages without copying, and record batches can be streamed one at a time.
+
+This is an opt-in helper for local work: the notebooks and the agent read the Unity Catalog
+copies of these tables, not the CSVs, so nothing in this repo calls it yet.
+
+Usage:
+    from table_cache import open_table, iter_batches
+
+    docs = open_table("product_docs", columns=["product_id", "indexed_doc"])
+    for batch in iter_batches("cust_service_data", columns=["customer_id", "date_time"]):
+        ...
+"""
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Iterator, List, Optional
+
+import pyarrow as pa
+import pyarrow.csv as pacsv
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+
+# Explicit column types, since the streaming CSV reader would infer them from the first block only
+SCHEMAS = {
+    "cust_service_data": pa.schema([
+        ("customer_id", pa.string()),
+        ("name", pa.string()),
+        ("email", pa.string()),
+        ("phone_number", pa.string()),
+        ("address", pa.string()),
+        ("interaction_id", pa.string()),
+        ("date_time", pa.timestamp("ns", tz="UTC")),
+        ("issue_category", pa.string()),
+        ("issue_description", pa.string()),
+        ("agent_id", pa.int64()),
+    ]),
+    "policies": pa.schema([
+        ("policy", pa.string()),
+        ("policy_details", pa.string()),
+        ("last_updated", pa.date32()),
+    ]),
+    "product_docs": pa.schema([
+        ("product_category", pa.string()),
+        ("product_sub_category", pa.string()),
+        ("product_name", pa.string()),
+        ("product_doc", pa.string()),
+        ("product_id", pa.string()),
+        ("indexed_doc", pa.string()),
+    ]),
+}
+TABLES = tuple(SCHEMAS)
+
+# product_docs.csv holds multi-line markdown in quoted fields
+_PARSE_OPTIONS = pacsv.ParseOptions(newlines_in_values=True)
+# Rows per cached record batch, so that iter_batches streams bounded chunks
+BATCH_ROWS = 128
+
+
+def source_hash(path: Path) -> str:
+    """Return the sha256 hex digest of a source file."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def cache_path(table: str, data_dir: Path = DATA_DIR) -> Path:
+    """
+    Return the cache file for `table` matching the current contents of its CSV.
+    The source hash is reused from `<table>.stamp` while the CSV's size and mtime are unchanged.
+    """
+    source = Path(data_dir) / f"{table}.csv"
+    cache_dir = Path(data_dir) / ".cache"
+    stamp = cache_dir / f"{table}.stamp"
+    stat = source.stat()
+    key = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+    try:
+        saved = json.loads(stamp.read_text())
+    except (OSError, ValueError):
+        saved = {}
+    if saved.get("size") == key["size"] and saved.get("mtime_ns") == key["mtime_ns"] and "sha256" in saved:
+        digest = saved["sha256"]
+    else:
+        digest = source_hash(source)
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        stamp.write_text(json.dumps({**key, "sha256": digest}))
+    return cache_dir / f"{table}-{digest[:16]}.arrow"
+
+
+def build_cache(table: str, data_dir: Path = DATA_DIR) -> Path:
+    """
+    Convert `data_dir/<table>.csv` to Arrow IPC if no cache exists for its current hash.
+    The CSV is streamed block by block and written in batches of at most `BATCH_ROWS` rows.
+    Stale caches of the same table are removed.
+    """
+    target = cache_path(table, data_dir)
+    if target.exists():
+        return target
+
+    target.parent.mkdir(parents=True, exist_ok=True)
+    # Unique temp file per builder, renamed atomically so readers never see a partial cache
+    with tempfile.NamedTemporaryFile(dir=target.parent, prefix=f"{table}-", suffix=".tmp", delete=False) as f:
+        tmp = Path(f.name)
+    try:
+        reader = pacsv.open_csv(
+            Path(data_dir) / f"{table}.csv",
+            parse_options=_PARSE_OPTIONS,
+            convert_options=pacsv.ConvertOptions(column_types=SCHEMAS[table]),
+        )
+        with pa.OSFile(str(tmp), "wb") as sink, pa.ipc.new_file(sink, reader.schema) as writer:
+            for batch in reader:
+                writer.write_table(pa.Table.from_batches([batch]), max_chunksize=BATCH_ROWS)
+        os.replace(tmp, target)
+    finally:
+        tmp.unlink(missing_ok=True)
+
+    for stale in target.parent.glob(f"{table}-*.arrow"):
+        if stale != target:
+            stale.unlink(missing_ok=True)
+    return target
+
+
+def open_table(table: str, columns: Optional[List[str]] = None, data_dir: Path = DATA_DIR) -> pa.Table:
+    """
+    Open a cached table memory-mapped, keeping only `columns` if given.
+    The file handle is closed on return; the mapping stays alive as long as the returned table.
+    """
+    with pa.memory_map(str(build_cache(table, data_dir)), "r") as source, pa.ipc.open_file(source) as reader:
+        arrow_table = reader.read_all()
+    return arrow_table.select(columns) if columns else arrow_table
+
+
+def iter_batches(
+    table: str, columns: Optional[List[str]] = None, data_dir: Path = DATA_DIR
+) -> Iterator[pa.RecordBatch]:
+    """Stream the record batches of a cached table, keeping only `columns` if given."""
+    with pa.memory_map(str(build_cache(table, data_dir)), "r") as source, pa.ipc.open_file(source) as reader:
+        for i in range(reader.num_record_batches):
+            batch = reader.get_batch(i)
+            yield batch.select(columns) if columns else batch
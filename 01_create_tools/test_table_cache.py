@@ -0,0 +1,78 @@
+import csv
+import shutil
+
+import pytest
+
+pytest.importorskip("pyarrow")
+
+import table_cache
+from table_cache import BATCH_ROWS, DATA_DIR, TABLES, build_cache, iter_batches, open_table
+
+
+def csv_rows(path):
+    with open(path, newline="") as f:
+        return sum(1 for _ in csv.DictReader(f))
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    """Copy of data/ so the tests never write caches into the repo."""
+    for table in TABLES:
+        shutil.copy(DATA_DIR / f"{table}.csv", tmp_path)
+    return tmp_path
+
+
+@pytest.mark.parametrize("table", TABLES)
+def test_row_counts_match_csv(data_dir, table):
+    expected = csv_rows(data_dir / f"{table}.csv")
+    assert open_table(table, data_dir=data_dir).num_rows == expected
+    assert sum(batch.num_rows for batch in iter_batches(table, data_dir=data_dir)) == expected
+
+
+def test_batches_are_bounded(data_dir):
+    batches = list(iter_batches("product_docs", data_dir=data_dir))
+    assert len(batches) > 1
+    assert all(batch.num_rows <= BATCH_ROWS for batch in batches)
+
+
+def test_column_projection(data_dir):
+    columns = ["product_id", "product_name"]
+    assert open_table("product_docs", columns=columns, data_dir=data_dir).column_names == columns
+    assert all(batch.schema.names == columns for batch in iter_batches("product_docs", columns, data_dir))
+
+
+def test_warm_open_reuses_cache(data_dir, monkeypatch):
+    path = build_cache("product_docs", data_dir)
+    mtime = path.stat().st_mtime_ns
+
+    def fail(*args, **kwargs):
+        raise AssertionError("source was re-read on a warm open")
+
+    monkeypatch.setattr(table_cache, "source_hash", fail)
+    monkeypatch.setattr(table_cache.pacsv, "open_csv", fail)
+    open_table("product_docs", data_dir=data_dir)
+    list(iter_batches("product_docs", data_dir=data_dir))
+    assert path.stat().st_mtime_ns == mtime
+
+
+def test_cache_invalidated_after_csv_edit(data_dir):
+    expected = csv_rows(data_dir / "policies.csv") + 1
+    old = build_cache("policies", data_dir)
+    with open(data_dir / "policies.csv", "a", newline="") as f:
+        csv.writer(f).writerow(["Test Policy", "Added by test", "2024-01-01"])
+
+    new = build_cache("policies", data_dir)
+    assert new != old
+    assert not old.exists()
+    assert open_table("policies", data_dir=data_dir).num_rows == expected
+    assert not list(new.parent.glob("*.tmp"))
+
+
+def test_failed_build_leaves_no_temp_file(data_dir, monkeypatch):
+    def fail(*args, **kwargs):
+        raise ValueError("bad csv")
+
+    monkeypatch.setattr(table_cache.pacsv, "open_csv", fail)
+    with pytest.raises(ValueError):
+        build_cache("policies", data_dir)
+    assert not list((data_dir / ".cache").glob("policies-*"))
@@ -99,7 +99,7 @@ print(f"Functions in {uc_functions}:")
 
 from langgraph.prebuilt import create_react_agent
 
-sql_prompt = "You are helpful agent that can use these SQL queries to get latest interaction from a queue of customer service requests, extract the product name from the customer request, get request history of a customer and query policies for return, refund or exchange."
+sql_prompt = "You are helpful agent that can use these SQL queries to get latest interaction from a queue of customer service requests, extract the product name from the customer request, get request history of a customer and query policies for return, refund or exchange. Whenever you need more than one fact about a customer (contact details, request counts per issue category, past interactions), call get_customer_profile once instead of several other tools; it reads a periodically rebuilt snapshot. Use get_requests_history only when the request counts per issue category must reflect the live data. For the latest interaction in the queue, always use get_latest_interaction, which reads live data. A name may match several customers in get_customer_profile; if more than one profile is returned, do not merge them or pick the first one, but ask for or use the customer_id, email or phone number to choose the right one."
 sql_agent = create_react_agent(llm, tools=sql_tools, 
                                prompt=sql_prompt, name="sql")
 
@@ -183,7 +183,7 @@ retriever_agent = create_react_agent(llm, tools=[retriever_tool],
 from langgraph_supervisor import create_supervisor
 
 supervisor_prompt = """You are a supervisor managing several agents:
-1. SQL agent: assign specific SQL query tasks to this agent such as extracting product names and looking up return policies and request history
+1. SQL agent: assign specific SQL query tasks to this agent such as extracting product names, looking up customer profiles, return policies and request history
 2. calculator agent: assign calculation tasks to this agent
 3. genie agent: assign chat with customer service data tasks to this agent
 4. retriever agent: assign product documentation search tasks to this agent